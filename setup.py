@@ -35,9 +35,17 @@ setup(
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
+            "pytest-xdist>=2.0",
             "black>=21.0",
             "flake8>=3.8",
         ],
+        "onnx": [
+            "optimum[onnxruntime]",
+            "onnxruntime",
+        ],
+        "fast": [
+            "pyahocorasick",
+        ],
     },
     entry_points={
         "console_scripts": [
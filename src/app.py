@@ -2,8 +2,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from job_requirements_extractor import JobRequirementsExtractor
-import json
+from job_requirements_extractor import JobRequirementsExtractor, NER_MODELS
+import orjson
+import hashlib
 
 # Page configuration
 st.set_page_config(
@@ -38,6 +39,22 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def get_extractor(ner_model: str) -> JobRequirementsExtractor:
+    """Load the extractor once per NER model and share it across reruns and sessions."""
+    # Analyses are cached by analyze_cached, so the extractor's own cache is turned off
+    return JobRequirementsExtractor(ner_model_name=ner_model, analysis_cache_size=0)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def analyze_cached(ner_model: str, text_hash: str, _job_description: str) -> dict:
+    """
+    Analyze a job description, reusing the result for text already analyzed.
+    
+    The cache key is the NER model and the text hash; the leading underscore
+    stops Streamlit from hashing the full text again.
+    """
+    return get_extractor(ner_model).analyze_job_description(_job_description)
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">💼 Job Requirements Extractor</h1>', unsafe_allow_html=True)
@@ -46,9 +63,10 @@ def main():
     # Sidebar
     st.sidebar.title("Settings")
     model_option = st.sidebar.selectbox(
-        "Choose Model",
-        ["dbmdz/bert-large-cased-finetuned-conll03-english", "microsoft/DialoGPT-medium"],
-        help="Select the Hugging Face model to use for extraction"
+        "Choose NER Model",
+        list(NER_MODELS),
+        format_func=lambda size: f"{size} ({NER_MODELS[size]})",
+        help="Select the Hugging Face NER model used to extract entities; small is the faster distilled model"
     )
     
     confidence_threshold = st.sidebar.slider(
@@ -130,14 +148,12 @@ def main():
             if job_description.strip():
                 with st.spinner("Analyzing job description..."):
                     try:
-                        # Initialize extractor
-                        extractor = JobRequirementsExtractor(model_option)
-                        
-                        # Extract requirements
-                        analysis = extractor.analyze_job_description(job_description)
+                        # Extract requirements (served from cache if this text was already analyzed)
+                        text_hash = hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).hexdigest()
+                        analysis = analyze_cached(model_option, text_hash, job_description)
                         
                         # Display results
-                        display_results(analysis)
+                        display_results(analysis, f"{model_option}:{text_hash}")
                         
                     except Exception as e:
                         st.error(f"Error during extraction: {e}")
@@ -181,8 +197,33 @@ def main():
         - Resume optimization
         """)
 
-def display_results(analysis):
-    """Display the analysis results in an organized way."""
+@st.cache_data(show_spinner=False)
+def build_summary_chart(summary_values: tuple):
+    """Build the summary bar chart, reusing the figure for identical values."""
+    summary_data = {
+        'Metric': ['Total Sentences', 'Requirement Sentences', 'Requirement Density'],
+        'Value': list(summary_values)
+    }
+    
+    df_summary = pd.DataFrame(summary_data)
+    return px.bar(df_summary, x='Metric', y='Value', 
+                  title="Job Description Analysis Summary",
+                  color='Value', color_continuous_scale='Blues')
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def serialize_analysis(analysis_key: str, _analysis: dict) -> bytes:
+    """Encode an analysis as JSON once per analysis key rather than on every rerun."""
+    return orjson.dumps(
+        _analysis,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+def display_results(analysis, analysis_key: str):
+    """
+    Display the analysis results in an organized way.
+    
+    analysis_key identifies the analysis (model and text hash) for caching.
+    """
     st.success("✅ Analysis complete!")
     
     # Create columns for metrics
@@ -210,24 +251,29 @@ def display_results(analysis):
     # Individual requirements (bullet points and lists)
     if 'individual_requirements' in requirements and requirements['individual_requirements']:
         st.write(f"**🔹 Extracted Requirements: {len(requirements['individual_requirements'])} found**")
-        for i, req in enumerate(requirements['individual_requirements'], 1):
-            st.markdown(f"{i}. {req}")
+        # One markdown call for the whole list instead of one per requirement
+        st.markdown("\n".join(
+            f"{i}. {req}" for i, req in enumerate(requirements['individual_requirements'], 1)
+        ))
     
     # Categorized requirements
     if 'categorized_requirements' in requirements and requirements['categorized_requirements']:
         st.subheader("🏷️ Categorized Requirements")
         
         cats = requirements['categorized_requirements']
+        entries = [(category, items, len(items)) for category, items in cats.items()]
         
         # Create columns for categories
-        cols = st.columns(min(len(cats), 3))
+        cols = st.columns(min(len(entries), 3))
         
-        for i, (category, items) in enumerate(cats.items()):
+        for i, (category, items, n_items) in enumerate(entries):
             col_idx = i % 3
             with cols[col_idx]:
-                st.markdown(f"**{category.replace('_', ' ').title()} ({len(items)} items)**")
-                for item in items:  # Show all items
-                    st.markdown(f"• {item}")
+                # Header and all items in one markdown call (blank lines keep each bullet on its own line)
+                st.markdown("\n\n".join(
+                    [f"**{category.replace('_', ' ').title()} ({n_items} items)**"]
+                    + [f"• {item}" for item in items]
+                ))
     
     # Summary statistics
     if 'summary' in requirements:
@@ -235,21 +281,17 @@ def display_results(analysis):
         
         summary = requirements['summary']
         
-        # Create a bar chart for summary
-        summary_data = {
-            'Metric': ['Total Sentences', 'Requirement Sentences', 'Requirement Density'],
-            'Value': [
-                summary.get('total_sentences', 0),
-                summary.get('requirement_sentences', 0),
-                round(summary.get('requirement_density', 0) * 100, 1)
-            ]
-        }
+        # Create a bar chart for summary (skipped when there is nothing to plot)
+        summary_values = (
+            summary.get('total_sentences', 0),
+            summary.get('requirement_sentences', 0),
+            round(summary.get('requirement_density', 0) * 100, 1)
+        )
         
-        df_summary = pd.DataFrame(summary_data)
-        fig = px.bar(df_summary, x='Metric', y='Value', 
-                    title="Job Description Analysis Summary",
-                    color='Value', color_continuous_scale='Blues')
-        st.plotly_chart(fig, use_container_width=True)
+        if any(summary_values):
+            st.plotly_chart(build_summary_chart(summary_values), use_container_width=True)
+        else:
+            st.info("No sentences found to summarize.")
     
     # Recommendations
     if 'recommendations' in analysis and analysis['recommendations']:
@@ -262,11 +304,11 @@ def display_results(analysis):
     st.subheader("💾 Download Results")
     
     # Create JSON for download
-    json_str = json.dumps(analysis, indent=2, default=str)
+    json_bytes = serialize_analysis(analysis_key, analysis)
     
     st.download_button(
         label="📥 Download Analysis (JSON)",
-        data=json_str,
+        data=json_bytes,
         file_name="job_requirements_analysis.json",
         mime="application/json"
     )
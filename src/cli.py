@@ -7,12 +7,12 @@ import argparse
 import sys
 import json
 from pathlib import Path
-from job_requirements_extractor import JobRequirementsExtractor
 
 def read_file(file_path: str) -> str:
     """Read content from a file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # 1 MiB buffer keeps large descriptions to a handful of read calls
+        with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
             return f.read()
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
@@ -22,7 +22,7 @@ def save_results(results: dict, output_file: str):
     """Save results to a JSON file."""
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, default=str)
+            json.dump(results, f, indent=2)
         print(f"Results saved to {output_file}")
     except Exception as e:
         print(f"Error saving results: {e}")
@@ -83,9 +83,19 @@ def print_results(analysis: dict, verbose: bool = False):
     # Verbose output
     if verbose:
         print(f"\n🔍 DETAILED ANALYSIS:")
-        print(json.dumps(analysis, indent=2, default=str))
+        # Encode straight to stdout rather than building the whole string first
+        json.dump(analysis, sys.stdout, indent=2)
+        print()
 
-def main():
+# Argument parser, built on first use and reused by later main() calls
+_PARSER = None
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the CLI argument parser, building it once."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+    
     parser = argparse.ArgumentParser(
         description="Extract requirements from job descriptions using AI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -135,6 +145,12 @@ Examples:
         help='Hugging Face model to use (default: dbmdz/bert-large-cased-finetuned-conll03-english)'
     )
     
+    parser.add_argument(
+        '--ner-model',
+        default='small',
+        help='NER checkpoint: "small" (distilled, faster), "large" or a Hugging Face model name (default: small)'
+    )
+    
     parser.add_argument(
         '--confidence',
         type=float,
@@ -142,7 +158,11 @@ Examples:
         help='Minimum confidence threshold for entities (default: 0.7)'
     )
     
-    args = parser.parse_args()
+    _PARSER = parser
+    return parser
+
+def main():
+    args = get_parser().parse_args()
     
     # Get job description text
     if args.text:
@@ -165,8 +185,11 @@ Examples:
         print(f"📚 Using model: {args.model}")
         print(f"🎯 Confidence threshold: {args.confidence}")
         
+        # Import here so --help and input errors don't pay for loading transformers/torch
+        from job_requirements_extractor import JobRequirementsExtractor
+        
         # Initialize extractor
-        extractor = JobRequirementsExtractor(args.model)
+        extractor = JobRequirementsExtractor(args.model, ner_model_name=args.ner_model)
         
         print("🔍 Analyzing job description...")
         
@@ -5,26 +5,52 @@ A comprehensive tool for extracting and analyzing requirements from job descript
 using advanced NLP techniques including Named Entity Recognition and pattern matching.
 """
 
-from .extractor import JobRequirementsExtractor
-from .batch_processor import BatchJobProcessor
+import importlib
+
+from .cache import AnalysisCache
 from .config import (
     DEFAULT_MODEL,
     NER_CONFIDENCE_THRESHOLD,
+    NER_MODELS,
+    DEFAULT_NER_MODEL,
     REQUIREMENT_PATTERNS,
+    COMPILED_REQUIREMENT_PATTERNS,
     REQUIREMENT_CATEGORIES,
     get_env_config,
     validate_config
 )
 
+# Model-backed classes are imported on first access so that importing the
+# package (e.g. for config or CLI --help) does not load transformers/torch
+_LAZY_IMPORTS = {
+    "JobRequirementsExtractor": ".extractor",
+    "BatchJobProcessor": ".batch_processor",
+}
+
+def __getattr__(name):
+    """Lazily import JobRequirementsExtractor and BatchJobProcessor (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 __version__ = "1.0.0"
 __author__ = "Job Requirements Extractor Team"
 
 __all__ = [
     "JobRequirementsExtractor",
     "BatchJobProcessor",
+    "AnalysisCache",
     "DEFAULT_MODEL",
     "NER_CONFIDENCE_THRESHOLD",
+    "NER_MODELS",
+    "DEFAULT_NER_MODEL",
     "REQUIREMENT_PATTERNS",
+    "COMPILED_REQUIREMENT_PATTERNS",
     "REQUIREMENT_CATEGORIES",
     "get_env_config",
     "validate_config"
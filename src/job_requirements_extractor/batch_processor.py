@@ -4,49 +4,330 @@ Batch processor for analyzing multiple job descriptions
 """
 
 import os
-import json
-import csv
+import mmap
+import multiprocessing
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Iterable, Iterator
+import orjson
+import pandas as pd
+import torch
+from tqdm import tqdm
 from .extractor import JobRequirementsExtractor
-import argparse
+from .cache import AnalysisCache
+from .config import BATCH_SIZE
+
+# orjson options shared by the JSON and JSON Lines writers
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Files larger than this are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+# Extractors already loaded in this process, keyed on model name
+_EXTRACTOR_CACHE = {}
+
+# Per-process extractor and cache used by worker processes in process_directory
+_worker_extractor = None
+_worker_cache = None
+
+def _get_extractor(model_name: str) -> JobRequirementsExtractor:
+    """Return the extractor for model_name, loading the model only the first time."""
+    extractor = _EXTRACTOR_CACHE.get(model_name)
+    if extractor is None:
+        # The processor keeps its own AnalysisCache, so the extractor's is turned off
+        extractor = _EXTRACTOR_CACHE[model_name] = JobRequirementsExtractor(model_name, analysis_cache_size=0)
+    return extractor
+
+def _init_worker(model_name: str, quantize: bool, engine: str, ner_model_name: str, use_ner: bool,
+                 entity_cache_size: int, cache_size: int, num_threads: int):
+    """Load the extractor once in each worker process."""
+    global _worker_extractor, _worker_cache
+    # Split the cores between workers instead of letting each one use all of them
+    torch.set_num_threads(num_threads)
+    _worker_extractor = JobRequirementsExtractor(model_name, quantize=quantize, engine=engine,
+                                                 ner_model_name=ner_model_name, use_ner=use_ner,
+                                                 entity_cache_size=entity_cache_size, analysis_cache_size=0)
+    _worker_cache = AnalysisCache(cache_size) if cache_size > 0 else None
+
+def _read_job_file(file_path: str) -> Tuple[str, int]:
+    """Read a job description file, returning its text and its on-disk size in bytes."""
+    with open(file_path, 'rb') as f:
+        # One fstat on the open file gives the reported size and picks the read strategy
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size > MMAP_THRESHOLD:
+            # Decode straight from the mapped pages, skipping the intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, 'utf-8'), file_size
+        
+        raw = f.read()
+    
+    # ASCII-only files (the common case) skip the full UTF-8 decoder
+    content = raw.decode('ascii') if raw.isascii() else raw.decode('utf-8')
+    return content, file_size
+
+def _try_read_job_file(file_path: str):
+    """Read a job description file, returning ((content, size), None) or (None, error)."""
+    try:
+        return _read_job_file(file_path), None
+    except Exception as e:
+        return None, e
+
+def _prefetch(items: Iterable, depth: int = 2) -> Iterator:
+    """
+    Iterate over items while a background thread produces the next ones.
+    
+    Up to depth items are read ahead, so slow reads overlap with whatever the
+    caller does with the current item. Errors raised by the producer are
+    re-raised in the caller.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+    
+    def put(item) -> bool:
+        # Give up if the consumer has stopped iterating
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+            return
+        put((done, None))
+    
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+
+def _file_error(file_path: str, error: Exception) -> Dict[str, Any]:
+    """Build the result recorded for a file that could not be processed."""
+    return {
+        'error': str(error),
+        'file_info': {
+            'filename': Path(file_path).name,
+            'file_path': str(file_path)
+        }
+    }
+
+def _analyze_text(extractor: JobRequirementsExtractor, text: str, cache: AnalysisCache = None) -> Dict[str, Any]:
+    """Analyze a job description, reusing the cached analysis of identical text."""
+    if cache is None:
+        return extractor.analyze_job_description(text)
+    
+    key = cache.make_key(extractor.model_name, text)
+    analysis = cache.get(key)
+    if analysis is None:
+        analysis = extractor.analyze_job_description(text)
+        cache.put(key, analysis)
+    return analysis
+
+def _analyze_file(extractor: JobRequirementsExtractor, file_path: str, cache: AnalysisCache = None,
+                  read: Tuple[str, int] = None) -> Dict[str, Any]:
+    """
+    Read a job description file and analyze it with the given extractor.
+    
+    read is the (content, size) of the file if it has already been read.
+    """
+    try:
+        # Read file content
+        content, file_size = read if read is not None else _read_job_file(file_path)
+        
+        # Extract requirements
+        analysis = _analyze_text(extractor, content, cache)
+        
+        # Add file metadata
+        analysis['file_info'] = {
+            'filename': Path(file_path).name,
+            'file_path': str(file_path),
+            'file_size': file_size
+        }
+        
+        return analysis
+        
+    except Exception as e:
+        return _file_error(file_path, e)
+
+def _process_one(file_path: str) -> Dict[str, Any]:
+    """Process a single file inside a worker process."""
+    return _analyze_file(_worker_extractor, file_path, _worker_cache)
+
+def _new_summary_stats() -> Dict[str, Any]:
+    """Create the running counters used to summarize results."""
+    return {
+        'total_files': 0,
+        'successful_analyses': 0,
+        'total_text_length': 0,
+        'total_word_count': 0,
+        'total_complexity': 0.0,
+        'total_requirements': 0,
+        'category_counts': Counter()
+    }
+
+def _update_summary_stats(stats: Dict[str, Any], result: Dict[str, Any]):
+    """Fold a single analysis result into the running summary counters."""
+    stats['total_files'] += 1
+    if 'error' in result:
+        return
+    
+    stats['successful_analyses'] += 1
+    stats['total_text_length'] += result.get('text_length', 0)
+    stats['total_word_count'] += result.get('word_count', 0)
+    stats['total_complexity'] += result.get('complexity_score', 0)
+    
+    reqs = result.get('requirements', {})
+    stats['total_requirements'] += reqs.get('summary', {}).get('estimated_requirements', 0)
+    
+    for category, items in reqs.get('categorized_requirements', {}).items():
+        stats['category_counts'][category] += len(items)
 
 class BatchJobProcessor:
-    def __init__(self, model_name: str = None):
-        """Initialize the batch processor."""
-        self.extractor = JobRequirementsExtractor(model_name)
+    def __init__(self, model_name: str = None, verbose: bool = True, cache_size: int = 4096):
+        """
+        Initialize the batch processor.
+        
+        Args:
+            model_name: Name of the Hugging Face model to use
+            verbose: Show progress bars and status messages while processing
+            cache_size: Number of analyses to keep for duplicate descriptions (0 disables)
+        """
+        self.verbose = verbose
+        # Shared with other processors using the same model (the extractor is thread-safe)
+        self.extractor = _get_extractor(model_name)
+        self.cache_size = cache_size
+        self.cache = AnalysisCache(cache_size) if cache_size > 0 else None
         self.results = []
+        self.summary_stats = None
+    
+    def _progress(self, iterable=None, **kwargs) -> tqdm:
+        """Create a progress bar that redraws at most ten times a second (hidden unless verbose)."""
+        return tqdm(iterable, desc='Processing', mininterval=0.1, disable=not self.verbose, **kwargs)
     
     def process_file(self, file_path: str) -> Dict[str, Any]:
         """Process a single job description file."""
-        try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract requirements
-            analysis = self.extractor.analyze_job_description(content)
+        return _analyze_file(self.extractor, file_path, self.cache)
+    
+    def _analyze_texts(self, texts: List[str], batch_size: int) -> List[Dict[str, Any]]:
+        """Analyze texts with batched NER calls, analyzing each distinct uncached text once."""
+        if self.cache is None:
+            return self.extractor.analyze_batch(texts, batch_size=batch_size)
+        
+        analyses = [None] * len(texts)
+        pending = {}
+        for i, text in enumerate(texts):
+            key = self.cache.make_key(self.extractor.model_name, text)
+            if key in pending:
+                # Duplicate of a text earlier in this batch
+                pending[key].append(i)
+                continue
             
-            # Add file metadata
+            analyses[i] = self.cache.get(key)
+            if analyses[i] is None:
+                pending[key] = [i]
+        
+        keys = list(pending)
+        fresh = self.extractor.analyze_batch([texts[pending[key][0]] for key in keys], batch_size=batch_size)
+        for key, analysis in zip(keys, fresh):
+            self.cache.put(key, analysis)
+            first, *duplicates = pending[key]
+            analyses[first] = analysis
+            for i in duplicates:
+                analyses[i] = dict(analysis)
+        
+        return analyses
+    
+    def _collect_result(self, result: Dict[str, Any], results: List[Dict[str, Any]], output_stream=None):
+        """Keep a result in memory, or write it as a JSON line when streaming."""
+        if output_stream is None:
+            results.append(result)
+            return
+        
+        output_stream.write(orjson.dumps(result, option=ORJSON_OPTIONS).decode() + '\n')
+        _update_summary_stats(self.summary_stats, result)
+    
+    def process_files_batched(self, file_paths: List[str], batch_size: int = 8) -> List[Dict[str, Any]]:
+        """Process several files, running the NER model over batches of documents."""
+        if self.verbose:
+            print(f"Analyzing {len(file_paths)} files in batches of {batch_size}")
+        
+        results = self._analyze_files_batched(file_paths, batch_size)
+        
+        self.results = results
+        self.summary_stats = None
+        return results
+    
+    def _analyze_files_batched(self, file_paths: List[str], batch_size: int,
+                               executor: ThreadPoolExecutor = None) -> List[Dict[str, Any]]:
+        """
+        Read and analyze files with the shared extractor using batched NER calls.
+        
+        Args:
+            executor: Thread pool used to read the files; a temporary one is created if omitted
+        """
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                return self._analyze_files_batched(file_paths, batch_size, executor)
+        
+        results = [None] * len(file_paths)
+        contents = []
+        file_sizes = []
+        content_indices = []
+        
+        # Read all files up front (concurrently, I/O releases the GIL) so the model sees full batches
+        for i, (read, error) in enumerate(executor.map(_try_read_job_file, file_paths)):
+            if error is not None:
+                results[i] = _file_error(file_paths[i], error)
+                continue
+            contents.append(read[0])
+            file_sizes.append(read[1])
+            content_indices.append(i)
+        
+        analyses = self._analyze_texts(contents, batch_size)
+        
+        for i, file_size, analysis in zip(content_indices, file_sizes, analyses):
             analysis['file_info'] = {
-                'filename': Path(file_path).name,
-                'file_path': str(file_path),
-                'file_size': len(content)
-            }
-            
-            return analysis
-            
-        except Exception as e:
-            return {
-                'error': str(e),
-                'file_info': {
-                    'filename': Path(file_path).name,
-                    'file_path': str(file_path)
-                }
+                'filename': Path(file_paths[i]).name,
+                'file_path': str(file_paths[i]),
+                'file_size': file_size
             }
+            results[i] = analysis
+        
+        return results
     
-    def process_directory(self, directory_path: str, file_extensions: List[str] = None) -> List[Dict[str, Any]]:
-        """Process all job description files in a directory."""
+    def process_directory(self, directory_path: str, file_extensions: List[str] = None,
+                          max_workers: int = None, output_stream=None,
+                          batch_size: int = 8) -> List[Dict[str, Any]]:
+        """
+        Process all job description files in a directory.
+        
+        On GPU the shared extractor always analyzes files in batches of
+        batch_size and max_workers is ignored. On CPU, max_workers <= 1
+        processes files serially; otherwise they are spread over a process
+        pool (one extractor per worker).
+        
+        If output_stream is given, each result is written to it as a JSON line
+        as soon as it is ready instead of being kept in memory; only summary
+        counters are retained and an empty list is returned.
+        """
         if file_extensions is None:
             file_extensions = ['.txt', '.md']
         
@@ -54,145 +335,217 @@ class BatchJobProcessor:
         if not directory.exists() or not directory.is_dir():
             raise ValueError(f"Directory {directory_path} does not exist")
         
-        # Find all matching files
-        files = []
-        for ext in file_extensions:
-            files.extend(directory.glob(f"*{ext}"))
+        # Find all matching files in one pass over the directory; like glob('*.txt'),
+        # names starting with a dot are included
+        extensions = tuple(file_extensions)
+        with os.scandir(directory) as entries:
+            files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(extensions) and entry.is_file()
+            )
         
-        print(f"Found {len(files)} files to process")
+        if self.verbose:
+            print(f"Found {len(files)} files to process")
+        
+        if max_workers is None:
+            max_workers = min(len(files), os.cpu_count() or 1)
         
         # Process each file
         results = []
-        for i, file_path in enumerate(files, 1):
-            print(f"Processing {i}/{len(files)}: {file_path.name}")
-            result = self.process_file(str(file_path))
-            results.append(result)
+        self.summary_stats = _new_summary_stats() if output_stream is not None else None
+        if self.extractor.device == "cuda":
+            # A single GPU model is best fed with batches rather than extra workers
+            paths = [str(file_path) for file_path in files]
+            # One reader pool serves every batch instead of a new one per batch
+            with ThreadPoolExecutor(max_workers=32) as readers, \
+                    self._progress(total=len(paths), unit='file') as progress:
+                for start in range(0, len(paths), batch_size):
+                    batch = paths[start:start + batch_size]
+                    for result in self._analyze_files_batched(batch, batch_size, readers):
+                        self._collect_result(result, results, output_stream)
+                        progress.update(1)
+        elif max_workers <= 1:
+            paths = [str(file_path) for file_path in files]
+            # Read upcoming files in the background while the current one is analyzed
+            reads = _prefetch(map(_try_read_job_file, paths), depth=8)
+            with self._progress(paths, unit='file') as progress:
+                for file_path, (read, error) in zip(progress, reads):
+                    if error is not None:
+                        result = _file_error(file_path, error)
+                    else:
+                        result = _analyze_file(self.extractor, file_path, self.cache, read)
+                    self._collect_result(result, results, output_stream)
+        else:
+            # Spawned workers start clean instead of inheriting the parent's torch threads
+            num_threads = max(1, (os.cpu_count() or 1) // max_workers)
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.extractor.model_name, self.extractor.quantize, self.extractor.engine,
+                          self.extractor.ner_model_name, self.extractor.use_ner,
+                          self.extractor.entity_cache_size, self.cache_size, num_threads)
+            ) as executor:
+                paths = [str(file_path) for file_path in files]
+                with self._progress(executor.map(_process_one, paths, chunksize=4),
+                                    total=len(paths), unit='file') as progress:
+                    for result in progress:
+                        self._collect_result(result, results, output_stream)
         
         self.results = results
         return results
     
-    def process_csv(self, csv_path: str, text_column: str = 'description', id_column: str = None) -> List[Dict[str, Any]]:
-        """Process job descriptions from a CSV file."""
+    def process_csv(self, csv_path: str, text_column: str = 'description', id_column: str = None,
+                    output_stream=None, batch_size: int = None,
+                    include_all_columns: bool = False) -> List[Dict[str, Any]]:
+        """
+        Process job descriptions from a CSV file.
+        
+        The CSV is read in chunks on a background thread and each chunk is
+        analyzed with batched NER calls of batch_size rows (config.BATCH_SIZE
+        by default) while the next one is parsed. Only the text and id columns
+        are loaded unless include_all_columns is set, in which case every
+        column of the source row is kept in row_info['all_columns'].
+        
+        If output_stream is given, results are streamed to it as JSON lines
+        (see process_directory).
+        """
         if not Path(csv_path).exists():
             raise ValueError(f"CSV file {csv_path} does not exist")
         
+        if batch_size is None:
+            batch_size = BATCH_SIZE
+        
         results = []
+        self.summary_stats = _new_summary_stats() if output_stream is not None else None
         
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for i, row in enumerate(reader, 1):
-                if text_column not in row:
+        wanted_columns = None if include_all_columns else (lambda column: column in (text_column, id_column))
+        try:
+            chunks = pd.read_csv(csv_path, chunksize=1024, dtype=str, keep_default_na=False,
+                                 usecols=wanted_columns)
+        except pd.errors.EmptyDataError:
+            chunks = []
+        
+        row_number = 0
+        with self._progress(unit='row') as progress:
+            # Parse the next chunk in the background while this one is analyzed
+            for chunk in _prefetch(chunks):
+                if text_column not in chunk.columns:
                     raise ValueError(f"Column '{text_column}' not found in CSV")
                 
-                print(f"Processing row {i}: {row.get(id_column, f'Row {i}')}")
+                # Extract requirements for the whole chunk
+                analyses = self._analyze_texts(chunk[text_column].tolist(), batch_size)
                 
-                # Extract requirements
-                analysis = self.extractor.analyze_job_description(row[text_column])
+                row_ids = chunk[id_column].tolist() if id_column in chunk.columns else None
+                rows = chunk.to_dict('records') if include_all_columns else None
                 
-                # Add row metadata
-                analysis['row_info'] = {
-                    'row_number': i,
-                    'row_id': row.get(id_column, f'Row_{i}'),
-                    'all_columns': row
-                }
+                for j, analysis in enumerate(analyses):
+                    row_number += 1
+                    
+                    # Add row metadata
+                    analysis['row_info'] = {
+                        'row_number': row_number,
+                        'row_id': row_ids[j] if row_ids is not None else f'Row_{row_number}'
+                    }
+                    if include_all_columns:
+                        analysis['row_info']['all_columns'] = rows[j]
+                    
+                    self._collect_result(analysis, results, output_stream)
                 
-                results.append(analysis)
+                progress.update(len(analyses))
         
         self.results = results
         return results
     
     def save_results(self, output_path: str, format: str = 'json'):
-        """Save results to a file."""
+        """
+        Save results to a file.
+        
+        Supported formats are 'json' (one array), 'jsonl' (one record per
+        line) and 'csv' (flattened metrics). To avoid holding results in
+        memory at all, pass output_stream to process_directory/process_csv
+        instead, which writes the same JSON Lines format while processing.
+        """
+        if self.summary_stats is not None:
+            print("Results were streamed during processing; nothing to save")
+            return
+        
         if format.lower() == 'json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.results, f, indent=2, default=str)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=ORJSON_OPTIONS | orjson.OPT_INDENT_2))
+        
+        elif format.lower() == 'jsonl':
+            with open(output_path, 'wb') as f:
+                for result in self.results:
+                    f.write(orjson.dumps(result, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE))
         
         elif format.lower() == 'csv':
-            # Flatten results for CSV export
-            flattened_results = []
-            for result in self.results:
-                flat_row = {}
+            # Flatten nested results into columns in one vectorized pass
+            if self.results:
+                df = pd.json_normalize(self.results, sep='_')
                 
-                # Add file/row info
-                if 'file_info' in result:
-                    flat_row.update({
-                        'filename': result['file_info']['filename'],
-                        'file_path': result['file_info']['file_path']
-                    })
-                elif 'row_info' in result:
-                    flat_row.update({
-                        'row_id': result['row_info']['row_id'],
-                        'row_number': result['row_info']['row_number']
-                    })
+                # Keep file/row info, basic metrics and the requirements summary
+                columns = {
+                    'file_info_filename': 'filename',
+                    'file_info_file_path': 'file_path',
+                    'row_info_row_id': 'row_id',
+                    'row_info_row_number': 'row_number',
+                    'text_length': 'text_length',
+                    'word_count': 'word_count',
+                    'complexity_score': 'complexity_score',
+                    'requirements_summary_total_sentences': 'total_sentences',
+                    'requirements_summary_requirement_sentences': 'requirement_sentences',
+                    'requirements_summary_requirement_density': 'requirement_density',
+                    'requirements_summary_estimated_requirements': 'estimated_requirements'
+                }
+                # The basic metrics are always written, even if every analysis failed
+                metrics = ['text_length', 'word_count', 'complexity_score']
+                flat_df = df.reindex(columns=[c for c in columns if c in df.columns or c in metrics])
+                flat_df = flat_df.rename(columns=columns)
                 
-                # Add basic metrics
-                flat_row.update({
-                    'text_length': result.get('text_length', 0),
-                    'word_count': result.get('word_count', 0),
-                    'complexity_score': result.get('complexity_score', 0)
-                })
+                # Failed analyses have no metrics; report them as 0
+                flat_df[metrics] = flat_df[metrics].fillna(0)
                 
-                # Add requirements summary
-                if 'requirements' in result and 'summary' in result['requirements']:
-                    summary = result['requirements']['summary']
-                    flat_row.update({
-                        'total_sentences': summary.get('total_sentences', 0),
-                        'requirement_sentences': summary.get('requirement_sentences', 0),
-                        'requirement_density': summary.get('requirement_density', 0),
-                        'estimated_requirements': summary.get('estimated_requirements', 0)
-                    })
+                # Failed analyses leave gaps; keep count columns as integers anyway
+                for column in ('row_number', 'text_length', 'word_count', 'total_sentences',
+                               'requirement_sentences', 'estimated_requirements'):
+                    if column in flat_df.columns:
+                        flat_df[column] = flat_df[column].astype('Int64')
                 
                 # Add categorized requirements count
-                if 'requirements' in result and 'categorized_requirements' in result['requirements']:
-                    cats = result['requirements']['categorized_requirements']
-                    for category, items in cats.items():
-                        flat_row[f'{category}_count'] = len(items)
+                category_prefix = 'requirements_categorized_requirements_'
+                for column in df.columns:
+                    if column.startswith(category_prefix):
+                        category = column[len(category_prefix):]
+                        flat_df[f'{category}_count'] = df[column].str.len().fillna(0).astype(int)
                 
-                flattened_results.append(flat_row)
-            
-            # Write CSV
-            if flattened_results:
-                fieldnames = flattened_results[0].keys()
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(flattened_results)
+                flat_df.to_csv(output_path, index=False)
         
         print(f"Results saved to {output_path}")
     
     def generate_summary_report(self) -> Dict[str, Any]:
         """Generate a summary report of all processed jobs."""
+        if self.summary_stats is not None and self.summary_stats['total_files'] > 0:
+            # Results were streamed, so only the running counters are available
+            return self._format_summary_report(self.summary_stats)
+        
         if not self.results:
             return {"error": "No results to summarize"}
         
-        # Calculate aggregate statistics
-        total_files = len(self.results)
-        successful_analyses = len([r for r in self.results if 'error' not in r])
-        failed_analyses = total_files - successful_analyses
-        
-        # Aggregate metrics
-        total_text_length = sum(r.get('text_length', 0) for r in self.results if 'error' not in r)
-        total_word_count = sum(r.get('word_count', 0) for r in self.results if 'error' not in r)
-        avg_complexity = sum(r.get('complexity_score', 0) for r in self.results if 'error' not in r) / successful_analyses if successful_analyses > 0 else 0
-        
-        # Requirements summary
-        total_requirements = 0
-        category_counts = {}
-        
+        # Aggregate all statistics in a single pass over the results
+        stats = _new_summary_stats()
         for result in self.results:
-            if 'error' not in result and 'requirements' in result:
-                reqs = result['requirements']
-                
-                if 'summary' in reqs:
-                    total_requirements += reqs['summary'].get('estimated_requirements', 0)
-                
-                if 'categorized_requirements' in reqs:
-                    cats = reqs['categorized_requirements']
-                    for category, items in cats.items():
-                        if category not in category_counts:
-                            category_counts[category] = 0
-                        category_counts[category] += len(items)
+            _update_summary_stats(stats, result)
+        
+        return self._format_summary_report(stats)
+    
+    def _format_summary_report(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the summary report from aggregated counters."""
+        total_files = stats['total_files']
+        successful_analyses = stats['successful_analyses']
+        failed_analyses = total_files - successful_analyses
+        total_requirements = stats['total_requirements']
+        avg_complexity = stats['total_complexity'] / successful_analyses if successful_analyses > 0 else 0
         
         summary = {
             'total_files_processed': total_files,
@@ -200,15 +553,15 @@ class BatchJobProcessor:
             'failed_analyses': failed_analyses,
             'success_rate': successful_analyses / total_files if total_files > 0 else 0,
             'aggregate_metrics': {
-                'total_text_length': total_text_length,
-                'total_word_count': total_word_count,
+                'total_text_length': stats['total_text_length'],
+                'total_word_count': stats['total_word_count'],
                 'average_complexity_score': round(avg_complexity, 2)
             },
             'requirements_summary': {
                 'total_requirements_found': total_requirements,
                 'average_requirements_per_job': round(total_requirements / successful_analyses, 2) if successful_analyses > 0 else 0
             },
-            'category_distribution': category_counts
+            'category_distribution': dict(stats['category_counts'])
         }
         
         return summary
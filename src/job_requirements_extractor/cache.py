@@ -0,0 +1,60 @@
+"""
+In-memory cache of job description analyses keyed on the description text
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+class AnalysisCache:
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize a least-recently-used cache of analyses.
+        
+        Args:
+            maxsize: Maximum number of analyses to keep
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> Tuple[str, bytes]:
+        """Build a cache key from the model name and a digest of the text."""
+        return (model_name, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached analysis for key, or None on a miss.
+        
+        The copy is shallow: callers may add top-level keys (such as file or
+        row metadata) without affecting the cached entry.
+        """
+        analysis = self._entries.get(key)
+        if analysis is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(analysis)
+
+    def put(self, key: Tuple[str, bytes], analysis: Dict[str, Any]):
+        """Store a copy of an analysis, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        
+        self._entries[key] = dict(analysis)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached analyses and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
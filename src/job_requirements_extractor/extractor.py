@@ -1,40 +1,230 @@
+import os
 import re
 import json
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any
 from transformers import pipeline, AutoTokenizer, AutoModelForTokenClassification
 import torch
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from .cache import AnalysisCache
+from .config import CACHE_MODELS, ONNX_CACHE_DIR, NER_MODELS, DEFAULT_NER_MODEL
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional 'fast' extra; keyword matching falls back to regexes
+    ahocorasick = None
+
+# Marks a model that has not been loaded yet (None means loading failed)
+_NOT_LOADED = object()
+
+@lru_cache(maxsize=1)
+def _cpu_vnni_support():
+    """
+    Report whether the CPU has VNNI instructions (AVX512-VNNI or AVX-VNNI).
+    
+    Read from the /proc/cpuinfo flags; returns None where those are not
+    available (non-Linux platforms), so callers can fall back to other checks.
+    """
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    flags = line.split(':', 1)[1].split()
+                    return 'avx512_vnni' in flags or 'avx_vnni' in flags
+    except OSError:
+        pass
+    return None
+
+def _trie_regex(node: Dict[str, Any]) -> str:
+    """Build the regex for a keyword trie node, sharing common prefixes between branches."""
+    # A keyword ends here; for a substring search any longer keyword is redundant
+    if '' in node:
+        return ''
+    
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items())]
+    return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+def _keyword_regex(keywords: List[str]) -> re.Pattern:
+    """
+    Compile keywords into one regex that matches any of them as a substring.
+    
+    Keywords are factored into a prefix trie (e.g. 'm(?:andatory|ust)') so the
+    regex engine tries each leading character once instead of once per keyword.
+    Only use the result to test for a match: the matched text may be a shorter
+    keyword than a plain alternation would report.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return re.compile(_trie_regex(trie) if trie else '')
+
+class _KeywordMatcher:
+    """Aho-Corasick keyword matcher with the search() interface of a keyword regex."""
+    __slots__ = ('_iter',)
+
+    def __init__(self, keywords: List[str]):
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        self._iter = automaton.iter
+
+    def search(self, text: str):
+        """Return the first (end_index, keyword) found in text, or None."""
+        return next(self._iter(text), None)
+
+def _keyword_pattern(keywords: List[str]):
+    """
+    Build a matcher whose search() finds any of the keywords as a substring.
+    
+    Uses an Aho-Corasick automaton (one linear pass, about twice as fast as
+    the regex on requirement sentences) when pyahocorasick is installed,
+    otherwise the trie-factored regex from _keyword_regex. Only the
+    truthiness of search() is meaningful across both.
+    """
+    if ahocorasick is not None and keywords and all(keywords):
+        return _KeywordMatcher(keywords)
+    return _keyword_regex(keywords)
+
+def _iter_segments(pattern: re.Pattern, text: str, min_length: int):
+    """
+    Yield the stripped pieces of text between matches of pattern that are at least min_length long.
+    
+    Equivalent to filtering pattern.split(text), but pieces too short to
+    qualify are skipped without being copied out of the text.
+    """
+    last = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        if start - last >= min_length:
+            segment = text[last:start].strip()
+            if len(segment) >= min_length:
+                yield segment
+        last = match.end()
+    
+    if len(text) - last >= min_length:
+        segment = text[last:].strip()
+        if len(segment) >= min_length:
+            yield segment
 
 class JobRequirementsExtractor:
-    def __init__(self, model_name: str = "microsoft/DialoGPT-medium"):
+    # Regexes used on every description, compiled once
+    _SPACES_RE = re.compile(r'[ \t]+')
+    _SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-\.\,\;\:\!\?\(\)•\-\*]')
+    _SENTENCE_SPLIT_RE = re.compile(r'[.!?]+|\n-|\n•|\n\*|\n\d+\.|\n\d+\)')
+    _SUMMARY_SPLIT_RE = re.compile(r'[.!?]+|\n-|\n•|\n\*')
+    _SENTENCE_END_RE = re.compile(r'[.!?]+')
+    _LEADING_MARKER_RE = re.compile(r'^[-•\*\s\d\.\)]+')
+    _BULLET_RE = re.compile(r'^[\s]*[-•\*\s\d\.\)]+[\s]*')
+    _INDENT_RE = re.compile(r'^[\s]{4,}')  # Lines with 4+ spaces (indented)
+    _SENTENCE_END_TO_SPACE = str.maketrans('.!?', '   ')
+    
+    # Keywords that indicate a sentence contains requirements
+    _REQUIREMENT_KEYWORDS_RE = _keyword_pattern([
+        'required', 'must', 'should', 'preferred', 'desired', 'essential',
+        'necessary', 'mandatory', 'experience', 'skills', 'knowledge',
+        'proficient', 'expert', 'skilled', 'qualified', 'background',
+        'understanding', 'familiarity', 'certification', 'degree',
+        'years', 'senior', 'junior', 'entry', 'level'
+    ])
+    
+    # Sentences that are general descriptions rather than requirements
+    _SKIP_INDICATORS_RE = _keyword_pattern([
+        'we offer', 'we provide', 'benefits include', 'responsibilities',
+        'duties', 'about us', 'company', 'team', 'culture'
+    ])
+    
+    # Keywords that mark a list item as a requirement
+    _REQUIREMENT_INDICATORS_RE = _keyword_pattern([
+        # Basic requirement keywords
+        'required', 'must', 'should', 'preferred', 'desired', 'essential',
+        'necessary', 'mandatory', 'experience', 'skills', 'knowledge',
+        'proficient', 'expert', 'skilled', 'qualified', 'background',
+        'understanding', 'familiarity', 'certification', 'degree',
+        'years', 'senior', 'junior', 'entry', 'level',
+        
+        # Technical skills
+        'python', 'java', 'javascript', 'aws', 'docker', 'kubernetes', 
+        'sql', 'agile', 'git', 'ci/cd', 'api', 'machine learning', 
+        'tensorflow', 'pytorch', 'microservices', 'monitoring', 'security',
+        'net', 'c#', 'asp.net', 'html', 'css', 'angular', 'ionic',
+        
+        # Management and leadership keywords
+        'lead', 'mentor', 'manage', 'team', 'leadership', 'management',
+        'foster', 'culture', 'conduct', 'reviews', 'planning', 'delivery',
+        'oversee', 'drive', 'ensure', 'maintain', 'champion', 'collaborate',
+        'liaise', 'translate', 'requirements', 'solutions', 'stakeholders',
+        'timelines', 'sprint', 'resource', 'allocation', 'progress',
+        'reporting', 'quality', 'operations', 'reliability', 'performance',
+        'security', 'production', 'improvement', 'innovation', 'processes'
+    ])
+    
+    # DataLoader workers that tokenize upcoming batches while the GPU runs the current one
+    # (chunked pipelines such as strided NER support at most one)
+    GPU_TOKENIZER_WORKERS = 1
+    
+    # Maximum number of sentence embeddings kept by encode_normalized
+    EMBEDDING_CACHE_SIZE = 4096
+    
+    _TECHNICAL_TERMS = frozenset([
+        'api', 'database', 'algorithm', 'framework', 'architecture', 'deployment', 'infrastructure'
+    ])
+
+    def __init__(self, model_name: str = "microsoft/DialoGPT-medium", quantize: bool = True,
+                 engine: str = "pt", entity_cache_size: int = 1024,
+                 ner_model_name: str = DEFAULT_NER_MODEL, use_ner: bool = True,
+                 analysis_cache_size: int = 128):
         """
         Initialize the job requirements extractor with a Hugging Face model.
         
         Args:
             model_name: Name of the Hugging Face model to use
+            quantize: Apply INT8 dynamic quantization to the NER model on CPU
+            engine: NER inference engine - "pt" (eager PyTorch), "pt_compile"
+                (torch.compile) or "ort" (ONNX Runtime, needs the onnx extra)
+            entity_cache_size: Number of NER results to keep for repeated texts (0 disables)
+            ner_model_name: Hugging Face NER checkpoint, or "small"/"large" for the
+                distilled or full-size model in config.NER_MODELS
+            use_ner: Run the NER model; when False it is never loaded and
+                entity_requirements is always empty
+            analysis_cache_size: Number of analyze_job_description results to keep
+                for repeated texts (0 disables)
         """
         self.model_name = model_name
+        self.ner_model_name = NER_MODELS.get(ner_model_name, ner_model_name)
+        self.use_ner = use_ner
+        self.quantize = quantize
+        self.engine = engine
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         
-        # Initialize the NER pipeline for extracting entities
-        try:
-            self.ner_pipeline = pipeline(
-                "ner",
-                model="dbmdz/bert-large-cased-finetuned-conll03-english",
-                device=0 if self.device == "cuda" else -1
-            )
-        except Exception as e:
-            # Silently continue if NER model fails to load
-            self.ner_pipeline = None
+        # Serialize pipeline calls so a shared instance is safe across threads
+        self._ner_lock = threading.Lock()
         
-        # Initialize sentence transformer for similarity matching
-        try:
-            self.sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2')
-        except Exception as e:
-            # Silently continue if sentence transformer fails to load
-            self.sentence_transformer = None
+        # LRU of filtered NER results keyed on a digest of the cleaned text
+        self.entity_cache_size = entity_cache_size
+        self._entity_cache = OrderedDict()
+        self._entity_cache_lock = threading.Lock()
+        
+        # Unit-length sentence embeddings keyed on a digest of the text
+        self._embedding_cache = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        
+        # LRU of complete analyses keyed on a digest of the job description
+        self.analysis_cache = AnalysisCache(analysis_cache_size) if analysis_cache_size > 0 else None
+        self._analysis_cache_lock = threading.Lock()
+        
+        # The NER pipeline and sentence transformer are loaded on first use
+        self._model_load_lock = threading.Lock()
+        self._ner_pipeline = _NOT_LOADED if use_ner else None
+        self._sentence_transformer = _NOT_LOADED
         
         # Common job requirement patterns
         self.requirement_patterns = [
@@ -58,6 +248,158 @@ class JobRequirementsExtractor:
             'tools': ['git', 'jira', 'confluence', 'slack', 'teams'],
             'methodologies': ['agile', 'scrum', 'waterfall', 'kanban']
         }
+        
+        # One compiled keyword pattern per category for _categorize_requirements
+        self._category_patterns = {
+            category: _keyword_pattern(keywords) for category, keywords in self.categories.items()
+        }
+
+    @property
+    def ner_pipeline(self):
+        """NER pipeline for extracting entities, loaded on first access (None if it failed to load)."""
+        if self._ner_pipeline is _NOT_LOADED:
+            with self._model_load_lock:
+                if self._ner_pipeline is _NOT_LOADED:
+                    self._ner_pipeline = self._build_ner_pipeline()
+        return self._ner_pipeline
+
+    @ner_pipeline.setter
+    def ner_pipeline(self, value):
+        self._ner_pipeline = value
+
+    @property
+    def sentence_transformer(self):
+        """Sentence transformer for similarity matching, loaded on first access (None if it failed to load)."""
+        if self._sentence_transformer is _NOT_LOADED:
+            with self._model_load_lock:
+                if self._sentence_transformer is _NOT_LOADED:
+                    self._sentence_transformer = self._build_sentence_transformer()
+        return self._sentence_transformer
+
+    @sentence_transformer.setter
+    def sentence_transformer(self, value):
+        self._sentence_transformer = value
+
+    def _build_ner_pipeline(self):
+        """Load the NER pipeline, returning None if the model cannot be loaded."""
+        try:
+            ner_tokenizer = AutoTokenizer.from_pretrained(self.ner_model_name)
+            ner_model = self._load_ner_model(self.ner_model_name, ner_tokenizer)
+            
+            return pipeline(
+                "ner",
+                model=ner_model,
+                tokenizer=ner_tokenizer,
+                device=0 if self.device == "cuda" else -1,
+                aggregation_strategy="simple",
+                # Long descriptions are split into overlapping 512-token windows
+                stride=64
+            )
+        except Exception as e:
+            # Silently continue if NER model fails to load
+            return None
+
+    def _build_sentence_transformer(self):
+        """Load the sentence transformer, returning None if it cannot be loaded."""
+        try:
+            sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2', device=self.device)
+            if self.device == "cuda":
+                # Half precision on GPU, matching the NER model
+                sentence_transformer.half()
+            return sentence_transformer
+        except Exception as e:
+            # Silently continue if sentence transformer fails to load
+            return None
+
+    def _load_ner_model(self, ner_model_name: str, tokenizer=None):
+        """Load the NER model for the configured engine (tokenizer is used to warm up compiled models)."""
+        if self.engine == "ort":
+            try:
+                import onnxruntime
+                from optimum.onnxruntime import ORTModelForTokenClassification
+                
+                session_options = onnxruntime.SessionOptions()
+                session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+                session_options.intra_op_num_threads = os.cpu_count() or 1
+                
+                # Reuse an earlier export instead of converting the model on every start
+                export_dir = os.path.join(ONNX_CACHE_DIR, ner_model_name.replace('/', '--'))
+                exported = os.path.isfile(os.path.join(export_dir, 'model.onnx'))
+                
+                model = ORTModelForTokenClassification.from_pretrained(
+                    export_dir if exported else ner_model_name,
+                    export=not exported,
+                    provider="CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider",
+                    session_options=session_options
+                )
+                
+                if not exported and CACHE_MODELS:
+                    try:
+                        model.save_pretrained(export_dir)
+                    except Exception as e:
+                        # Caching the export is best effort; the loaded model is still usable
+                        pass
+                
+                return model
+            except Exception as e:
+                # Fall back to PyTorch if ONNX Runtime is unavailable or export fails
+                pass
+        
+        # Half precision on GPU, full precision on CPU
+        model = AutoModelForTokenClassification.from_pretrained(
+            ner_model_name,
+            torch_dtype=torch.float16 if self.device == "cuda" else torch.float32
+        )
+        # Inference only: make sure dropout is off before quantizing/compiling
+        model.eval()
+        
+        if self.engine == "pt_compile":
+            # Compile instead of quantizing; dynamically quantized layers don't compile well
+            return self._compile_model(model, tokenizer)
+        
+        if self.quantize and self.device == "cpu":
+            model = self._quantize_model(model)
+        
+        return model
+
+    def _compile_model(self, model, tokenizer):
+        """Compile the model with torch.compile, returning the eager model if compilation fails."""
+        try:
+            model = model.to(self.device)
+            compiled = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+            
+            # Compile errors only surface on the first call, so make it here: otherwise
+            # _extract_entities would swallow them and quietly return no entities
+            inputs = tokenizer("Senior engineer with Python experience at Acme Corp.", return_tensors="pt")
+            with torch.inference_mode():
+                compiled(**inputs.to(self.device))
+            return compiled
+        except Exception as e:
+            # Fall back to eager PyTorch
+            return model
+
+    def _quantize_model(self, model):
+        """
+        Quantize Linear layers to INT8 on x86 CPUs with VNNI instructions.
+        
+        Without VNNI, INT8 matmuls gain little over FP32, so the model is left
+        as is. Where the CPU flags can't be read (non-Linux), quantization
+        runs whenever PyTorch has an x86 INT8 backend.
+        """
+        supported_engines = torch.backends.quantized.supported_engines
+        if not any(engine in supported_engines for engine in ('x86', 'fbgemm')):
+            # No optimized INT8 kernels on this CPU, keep the FP32 model
+            return model
+        
+        if _cpu_vnni_support() is False:
+            # No VNNI on this CPU, keep the FP32 model
+            return model
+        
+        try:
+            return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        except Exception as e:
+            # Fall back to the FP32 model if quantization fails
+            return model
 
     def extract_requirements(self, job_description: str) -> Dict[str, Any]:
         """
@@ -75,16 +417,59 @@ class JobRequirementsExtractor:
         # Clean the text for text-based extraction
         cleaned_text = self._clean_text(job_description)
         
+        return self._assemble_requirements(job_description, cleaned_text, self._extract_entities(cleaned_text))
+
+    def extract_requirements_batch(self, job_descriptions: List[str], batch_size: int = 8) -> List[Dict[str, Any]]:
+        """
+        Extract requirements from several job descriptions, batching the NER model calls.
+        
+        Args:
+            job_descriptions: List of job description texts
+            batch_size: Number of texts per NER forward pass
+            
+        Returns:
+            List of requirement dictionaries in the same order as the input texts;
+            repeated descriptions are extracted once and get shallow copies
+        """
+        # Positions of each distinct description, in first-seen order
+        positions = {}
+        for i, text in enumerate(job_descriptions):
+            positions.setdefault(text, []).append(i)
+        unique_texts = list(positions)
+        
+        cleaned_texts = [self._clean_text(text) if text else '' for text in unique_texts]
+        entity_lists = self._extract_entities_batch(cleaned_texts, batch_size)
+        
+        requirements = [None] * len(job_descriptions)
+        for job_description, cleaned_text, entities in zip(unique_texts, cleaned_texts, entity_lists):
+            if not job_description:
+                result = {"error": "No job description provided"}
+            else:
+                result = self._assemble_requirements(job_description, cleaned_text, entities)
+            
+            first, *duplicates = positions[job_description]
+            requirements[first] = result
+            for i in duplicates:
+                requirements[i] = dict(result)
+        
+        return requirements
+
+    def _assemble_requirements(self, job_description: str, cleaned_text: str,
+                               entity_requirements: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine the pattern-based extraction results with precomputed entities."""
         # Extract individual requirements from ORIGINAL text (before cleaning)
         individual_reqs = self._extract_individual_requirements(job_description)
         
+        # Sentence requirements from the original text, shared by categorization and summary
+        original_text_reqs = self._extract_text_patterns(job_description)
+        
         # Extract requirements using different methods
         requirements = {
             'text_requirements': self._extract_text_patterns(cleaned_text),
             'individual_requirements': individual_reqs,
-            'entity_requirements': self._extract_entities(cleaned_text),
-            'categorized_requirements': self._categorize_requirements(job_description),  # Use original text for categorization
-            'summary': self._generate_summary(job_description)  # Use original text for summary
+            'entity_requirements': entity_requirements,
+            'categorized_requirements': self._categorize_requirements(job_description, individual_reqs, original_text_reqs),  # Use original text for categorization
+            'summary': self._generate_summary(job_description, individual_reqs, original_text_reqs)  # Use original text for summary
         }
         
         return requirements
@@ -92,220 +477,273 @@ class JobRequirementsExtractor:
     def _clean_text(self, text: str) -> str:
         """Clean and preprocess the text."""
         # Remove extra whitespace but preserve newlines for bullet point detection
-        text = re.sub(r'[ \t]+', ' ', text)  # Only collapse spaces and tabs, not newlines
+        text = self._SPACES_RE.sub(' ', text)  # Only collapse spaces and tabs, not newlines
         # Remove special characters but keep important ones including bullet points
-        text = re.sub(r'[^\w\s\-\.\,\;\:\!\?\(\)•\-\*]', '', text)
+        text = self._SPECIAL_CHARS_RE.sub('', text)
         return text.strip()
 
     def _extract_text_patterns(self, text: str) -> List[str]:
         """Extract requirements using full sentences containing requirement keywords."""
         requirements = []
+        append = requirements.append  # bound once for the loop below
         
         # Split text into sentences and bullet points (more robust splitting)
         # Handle various sentence endings, bullet points, and numbered lists
-        sentences = re.split(r'[.!?]+|\n-|\n•|\n\*|\n\d+\.|\n\d+\)', text)
-        
-        # Define requirement keywords that indicate a sentence contains requirements
-        requirement_keywords = [
-            'required', 'must', 'should', 'preferred', 'desired', 'essential',
-            'necessary', 'mandatory', 'experience', 'skills', 'knowledge',
-            'proficient', 'expert', 'skilled', 'qualified', 'background',
-            'understanding', 'familiarity', 'certification', 'degree',
-            'years', 'senior', 'junior', 'entry', 'level'
-        ]
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            
-            # Skip very short sentences and empty ones
-            if len(sentence) < 10:
-                continue
-                
+        # Filter and clean sentences in the same pass over the split text,
+        # skipping very short sentences and empty ones
+        for sentence in _iter_segments(self._SENTENCE_SPLIT_RE, text, 10):
             # Check if sentence contains requirement-related content
             sentence_lower = sentence.lower()
             
             # Look for requirement keywords in the sentence
-            if any(keyword in sentence_lower for keyword in requirement_keywords):
-                # Additional filtering to ensure it's actually a requirement
-                # Skip sentences that are just general descriptions
-                skip_indicators = [
-                    'we offer', 'we provide', 'benefits include', 'responsibilities',
-                    'duties', 'about us', 'company', 'team', 'culture'
-                ]
-                
-                if not any(skip in sentence_lower for skip in skip_indicators):
-                    requirements.append(sentence)
-        
-        # Clean and format the requirements
-        cleaned_requirements = []
-        for req in requirements:
-            # Clean up the sentence
-            cleaned = req.strip()
+            if not self._REQUIREMENT_KEYWORDS_RE.search(sentence_lower):
+                continue
+            
+            # Additional filtering to ensure it's actually a requirement
+            # Skip sentences that are just general descriptions
+            if self._SKIP_INDICATORS_RE.search(sentence_lower):
+                continue
+            
             # Remove leading bullet points, dashes, or numbers
-            cleaned = re.sub(r'^[-•\*\s\d\.\)]+', '', cleaned)
+            cleaned = self._LEADING_MARKER_RE.sub('', sentence)
             # Ensure proper capitalization
-            if cleaned and len(cleaned) > 0:
+            if cleaned:
                 cleaned = cleaned[0].upper() + cleaned[1:] if cleaned[0].isalpha() else cleaned
-                cleaned_requirements.append(cleaned)
+                append(cleaned)
         
-        # Remove duplicates and return
-        return list(set(cleaned_requirements))
+        # Remove duplicates, keeping the order sentences appear in
+        return list(dict.fromkeys(requirements))
 
     def _extract_individual_requirements(self, text: str) -> List[str]:
         """Extract individual requirements from bullet points and lists."""
         individual_reqs = []
+        append = individual_reqs.append  # bound once for the loop below
         
         # Split by common list indicators
         lines = text.split('\n')
         
         for line in lines:
             # Skip empty lines (check before stripping)
-            if not line.strip():
+            stripped = line.strip()
+            if not stripped:
                 continue
                 
             # Check if line starts with bullet points, dashes, numbers, OR is indented
             # More flexible pattern matching including indented lines
-            is_bullet_point = re.match(r'^[\s]*[-•\*\s\d\.\)]+[\s]*', line)
-            is_indented = re.match(r'^[\s]{4,}', line)  # Lines with 4+ spaces (indented)
+            is_bullet_point = self._BULLET_RE.match(line)
             
-            if is_bullet_point or is_indented:
+            if is_bullet_point or self._INDENT_RE.match(line):
                 # Clean the line
                 if is_bullet_point:
-                    cleaned = re.sub(r'^[\s]*[-•\*\s\d\.\)]+[\s]*', '', line).strip()
+                    cleaned = line[is_bullet_point.end():].strip()
                 else:
-                    cleaned = line.strip()
+                    cleaned = stripped
                 
-                # Check if it contains requirement-related content
+                # Check if it contains requirement-related content (lowercasing only lines long enough)
                 if len(cleaned) > 3:  # Lower threshold for all list items
-                    line_lower = cleaned.lower()
-                    requirement_indicators = [
-                        # Basic requirement keywords
-                        'required', 'must', 'should', 'preferred', 'desired', 'essential',
-                        'necessary', 'mandatory', 'experience', 'skills', 'knowledge',
-                        'proficient', 'expert', 'skilled', 'qualified', 'background',
-                        'understanding', 'familiarity', 'certification', 'degree',
-                        'years', 'senior', 'junior', 'entry', 'level',
-                        
-                        # Technical skills
-                        'python', 'java', 'javascript', 'aws', 'docker', 'kubernetes', 
-                        'sql', 'agile', 'git', 'ci/cd', 'api', 'machine learning', 
-                        'tensorflow', 'pytorch', 'microservices', 'monitoring', 'security',
-                        'net', 'c#', 'asp.net', 'html', 'css', 'angular', 'ionic',
-                        
-                        # Management and leadership keywords
-                        'lead', 'mentor', 'manage', 'team', 'leadership', 'management',
-                        'foster', 'culture', 'conduct', 'reviews', 'planning', 'delivery',
-                        'oversee', 'drive', 'ensure', 'maintain', 'champion', 'collaborate',
-                        'liaise', 'translate', 'requirements', 'solutions', 'stakeholders',
-                        'timelines', 'sprint', 'resource', 'allocation', 'progress',
-                        'reporting', 'quality', 'operations', 'reliability', 'performance',
-                        'security', 'production', 'improvement', 'innovation', 'processes'
-                    ]
-                    
                     # Check if line contains any requirement indicators
-                    if any(indicator in line_lower for indicator in requirement_indicators):
+                    if self._REQUIREMENT_INDICATORS_RE.search(cleaned.lower()):
                         # Ensure proper capitalization
-                        if cleaned and len(cleaned) > 0:
-                            cleaned = cleaned[0].upper() + cleaned[1:] if cleaned[0].isalpha() else cleaned
-                            individual_reqs.append(cleaned)
+                        cleaned = cleaned[0].upper() + cleaned[1:] if cleaned[0].isalpha() else cleaned
+                        append(cleaned)
         
         return individual_reqs
 
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Fingerprint a text for the entity and embedding caches."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def _get_cached_entities(self, key: bytes):
+        """Return a copy of the cached entities for key, or None on a miss."""
+        with self._entity_cache_lock:
+            entities = self._entity_cache.get(key)
+            if entities is None:
+                return None
+            self._entity_cache.move_to_end(key)
+        return [dict(entity) for entity in entities]
+
+    def _put_cached_entities(self, key: bytes, entities: List[Dict[str, Any]]):
+        """Store a copy of filtered entities, evicting the least recently used entry if full."""
+        if self.entity_cache_size <= 0:
+            return
+        
+        with self._entity_cache_lock:
+            self._entity_cache[key] = [dict(entity) for entity in entities]
+            self._entity_cache.move_to_end(key)
+            if len(self._entity_cache) > self.entity_cache_size:
+                self._entity_cache.popitem(last=False)
+
     def _extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract named entities using the NER pipeline."""
         if not self.ner_pipeline:
             return []
         
+        key = self._text_key(text)
+        cached = self._get_cached_entities(key)
+        if cached is not None:
+            return cached
+        
         try:
-            entities = self.ner_pipeline(text)
+            # inference_mode also skips autograd view and version tracking
+            with self._ner_lock, torch.inference_mode():
+                entities = self.ner_pipeline(text)
             
-            # Filter for relevant entities
-            relevant_entities = []
-            for entity in entities:
-                try:
-                    # Ensure entity has required fields
-                    if not isinstance(entity, dict):
-                        continue
-                    
-                    # Handle both old and new entity formats
-                    entity_type = entity.get('entity_group') or entity.get('entity_type') or 'UNKNOWN'
-                    entity_text = entity.get('word') or entity.get('text') or str(entity)
-                    entity_score = entity.get('score') or 0.0
-                    
-                    if entity_score > 0.7:  # Only high-confidence entities
-                        relevant_entities.append({
-                            'text': entity_text,
-                            'type': entity_type,
-                            'confidence': entity_score
-                        })
-                except Exception as entity_error:
-                    # Silently continue on entity processing errors
-                    continue
-            
-            return relevant_entities
+            entities = self._filter_entities(entities)
         except Exception as e:
             # Return empty list on any extraction errors
             return []
+        
+        self._put_cached_entities(key, entities)
+        return entities
 
-    def _categorize_requirements(self, text: str) -> Dict[str, List[str]]:
+    def _extract_entities_batch(self, texts: List[str], batch_size: int = 8) -> List[List[Dict[str, Any]]]:
+        """Extract named entities for several texts with batched NER forward passes."""
+        results = [[] for _ in texts]
+        # NER disabled or failed to load (checked without triggering a load)
+        if self._ner_pipeline is None:
+            return results
+        
+        # Texts already seen are served from the entity cache and skip the model
+        keys = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._text_key(text)
+            cached = self._get_cached_entities(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                keys[i] = key
+        
+        # Nothing left for the model when every text was empty or cached;
+        # otherwise this is where the pipeline is loaded on first use
+        if not keys or not self.ner_pipeline:
+            return results
+        
+        # Sort by token count so each batch pads to a similar sequence length
+        order = list(keys)
+        lengths = self._token_lengths([texts[i] for i in order])
+        order = [i for _, i in sorted(zip(lengths, order))]
+        
+        try:
+            with self._ner_lock, torch.inference_mode():
+                # A list input goes through the pipeline's DataLoader; on GPU, worker processes
+                # overlap tokenization with inference (on CPU they would compete for the same cores)
+                batched = self.ner_pipeline(
+                    [texts[i] for i in order],
+                    batch_size=batch_size,
+                    num_workers=self.GPU_TOKENIZER_WORKERS if self.device == "cuda" else 0
+                )
+            
+            for i, entities in zip(order, batched):
+                results[i] = self._filter_entities(entities)
+                self._put_cached_entities(keys[i], results[i])
+        except Exception as e:
+            # Fall back to one document at a time so one bad input doesn't empty the batch
+            for i in order:
+                results[i] = self._extract_entities(texts[i])
+        
+        return results
+
+    def _token_lengths(self, texts: List[str]) -> List[int]:
+        """Count tokens per text with the NER tokenizer, falling back to character counts."""
+        try:
+            return list(self.ner_pipeline.tokenizer(texts, add_special_tokens=False, return_length=True)['length'])
+        except Exception as e:
+            # Character count is a close enough proxy if the tokenizer can't report lengths
+            return [len(text) for text in texts]
+
+    def _filter_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep high-confidence entities in a normalized format."""
+        relevant_entities = []
+        for entity in entities:
+            try:
+                # Ensure entity has required fields
+                if not isinstance(entity, dict):
+                    continue
+                
+                # Handle both old and new entity formats
+                entity_type = entity.get('entity_group') or entity.get('entity_type') or 'UNKNOWN'
+                entity_text = entity.get('word') or entity.get('text') or str(entity)
+                entity_score = entity.get('score') or 0.0
+                
+                if entity_score > 0.7:  # Only high-confidence entities
+                    relevant_entities.append({
+                        'text': entity_text,
+                        'type': entity_type,
+                        # Plain float (the pipeline returns numpy.float32) so results are JSON-native
+                        'confidence': float(entity_score)
+                    })
+            except Exception as entity_error:
+                # Silently continue on entity processing errors
+                continue
+        
+        return relevant_entities
+
+    def _categorize_requirements(self, text: str, individual_reqs: List[str] = None,
+                                 text_reqs: List[str] = None) -> Dict[str, List[str]]:
         """Categorize requirements into different types."""
-        categorized = {category: [] for category in self.categories.keys()}
+        categorized = {category: [] for category in self._category_patterns}
+        seen = {category: set() for category in self._category_patterns}
         
         # First, extract individual requirements for better categorization
-        individual_reqs = self._extract_individual_requirements(text)
+        if individual_reqs is None:
+            individual_reqs = self._extract_individual_requirements(text)
         
         # Also get text-based requirements
-        text_reqs = self._extract_text_patterns(text)
+        if text_reqs is None:
+            text_reqs = self._extract_text_patterns(text)
         
-        # Combine all requirements for categorization
-        all_requirements = individual_reqs + text_reqs
+        # Combine all requirements for categorization; a requirement found by both
+        # extractors is lowercased and matched against the categories only once
+        all_requirements = dict.fromkeys(individual_reqs + text_reqs)
         
         for req in all_requirements:
             if not req or len(req) < 10:
                 continue
                 
             req_lower = req.lower()
+            cleaned = None
             
             # Categorize based on content
-            for category, keywords in self.categories.items():
-                if any(keyword in req_lower for keyword in keywords):
-                    # Clean and format the requirement
-                    cleaned = req.strip()
-                    cleaned = re.sub(r'^[-•\*\s\d\.\)]+', '', cleaned)
-                    if cleaned and len(cleaned) > 0:
-                        cleaned = cleaned[0].upper() + cleaned[1:] if cleaned[0].isalpha() else cleaned
-                        # Avoid duplicates
-                        if cleaned not in categorized[category]:
-                            categorized[category].append(cleaned)
+            for category, pattern in self._category_patterns.items():
+                if pattern.search(req_lower):
+                    # Clean and format the requirement (once, however many categories match)
+                    if cleaned is None:
+                        cleaned = self._LEADING_MARKER_RE.sub('', req.strip())
+                        if cleaned and cleaned[0].isalpha():
+                            cleaned = cleaned[0].upper() + cleaned[1:]
+                    # Avoid duplicates
+                    if cleaned and cleaned not in seen[category]:
+                        seen[category].add(cleaned)
+                        categorized[category].append(cleaned)
         
         # Remove empty categories
         return {k: v for k, v in categorized.items() if v}
 
-    def _generate_summary(self, text: str) -> Dict[str, Any]:
+    def _generate_summary(self, text: str, individual_requirements: List[str] = None,
+                          extracted_requirements: List[str] = None) -> Dict[str, Any]:
         """Generate a summary of the requirements."""
         # Split into sentences using the same method as requirement extraction
-        sentences = re.split(r'[.!?]+|\n-|\n•|\n\*', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
-        
-        # Count requirement-related keywords
-        requirement_keywords = [
-            'required', 'must', 'should', 'preferred', 'desired', 'essential',
-            'necessary', 'mandatory', 'experience', 'skills', 'knowledge',
-            'proficient', 'expert', 'skilled', 'qualified', 'background',
-            'understanding', 'familiarity', 'certification', 'degree',
-            'years', 'senior', 'junior', 'entry', 'level'
-        ]
-        requirement_count = sum(1 for sentence in sentences 
-                              if any(keyword in sentence.lower() for keyword in requirement_keywords))
-        
-        # Get the actual extracted requirements count
-        extracted_requirements = self._extract_text_patterns(text)
-        individual_requirements = self._extract_individual_requirements(text)
+        # (sentences over 20 characters) and count those with requirement keywords in the same pass
+        total_sentences = 0
+        requirement_count = 0
+        for sentence in _iter_segments(self._SUMMARY_SPLIT_RE, text, 21):
+            total_sentences += 1
+            if self._REQUIREMENT_KEYWORDS_RE.search(sentence.lower()):
+                requirement_count += 1
+        
+        # Get the actual extracted requirements count (reuse results when provided)
+        if extracted_requirements is None:
+            extracted_requirements = self._extract_text_patterns(text)
+        if individual_requirements is None:
+            individual_requirements = self._extract_individual_requirements(text)
         
         return {
-            'total_sentences': len(sentences),
+            'total_sentences': total_sentences,
             'requirement_sentences': requirement_count,
-            'requirement_density': requirement_count / len(sentences) if sentences else 0,
+            'requirement_density': requirement_count / total_sentences if total_sentences else 0,
             'estimated_requirements': len(extracted_requirements) + len(individual_requirements)
         }
 
@@ -319,35 +757,79 @@ class JobRequirementsExtractor:
         Returns:
             Dictionary containing comprehensive analysis
         """
-        requirements = self.extract_requirements(job_description)
+        if self.analysis_cache is None:
+            return self._build_analysis(job_description, self.extract_requirements(job_description))
+        
+        key = self.analysis_cache.make_key(self.ner_model_name, job_description)
+        with self._analysis_cache_lock:
+            analysis = self.analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._build_analysis(job_description, self.extract_requirements(job_description))
+            with self._analysis_cache_lock:
+                self.analysis_cache.put(key, analysis)
+        return analysis
+
+    def clear_cache(self):
+        """Drop cached analyses, NER results and sentence embeddings."""
+        if self.analysis_cache is not None:
+            with self._analysis_cache_lock:
+                self.analysis_cache.clear()
+        with self._entity_cache_lock:
+            self._entity_cache.clear()
+        with self._embedding_cache_lock:
+            self._embedding_cache.clear()
+
+    def analyze_batch(self, job_descriptions: List[str], batch_size: int = 8) -> List[Dict[str, Any]]:
+        """
+        Analyze several job descriptions, batching the NER model calls.
+        
+        Args:
+            job_descriptions: List of job description texts
+            batch_size: Number of texts per NER forward pass
+            
+        Returns:
+            List of analyses in the same order as the input texts
+        """
+        requirements = self.extract_requirements_batch(job_descriptions, batch_size)
+        
+        return [self._build_analysis(job_description, reqs)
+                for job_description, reqs in zip(job_descriptions, requirements)]
+
+    def _build_analysis(self, job_description: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap extracted requirements with text metrics and recommendations."""
+        # Split words once for both the word count and the complexity score
+        words = job_description.split()
         
         # Add additional analysis
         analysis = {
             'requirements': requirements,
             'text_length': len(job_description),
-            'word_count': len(job_description.split()),
-            'complexity_score': self._calculate_complexity(job_description),
+            'word_count': len(words),
+            'complexity_score': self._calculate_complexity(job_description, words),
             'recommendations': self._generate_recommendations(requirements)
         }
         
         return analysis
 
-    def _calculate_complexity(self, text: str) -> float:
+    def _calculate_complexity(self, text: str, words: List[str] = None) -> float:
         """Calculate a complexity score for the job description."""
-        words = text.split()
+        if words is None:
+            words = text.split()
         if not words:
             return 0.0
         
         # Average word length
-        avg_word_length = sum(len(word) for word in words) / len(words)
+        avg_word_length = sum(map(len, words)) / len(words)
         
-        # Sentence complexity (longer sentences = more complex)
-        sentences = re.split(r'[.!?]+', text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences if s.strip()) / len(sentences) if sentences else 0
+        # Sentence complexity (longer sentences = more complex), without splitting into
+        # sentences: words per sentence summed = words once sentence ends become spaces,
+        # and splitting on sentence ends gives one more piece than there are matches
+        sentence_count = len(self._SENTENCE_END_RE.findall(text)) + 1
+        sentence_word_count = len(text.translate(self._SENTENCE_END_TO_SPACE).split())
+        avg_sentence_length = sentence_word_count / sentence_count
         
         # Technical term density
-        technical_terms = ['api', 'database', 'algorithm', 'framework', 'architecture', 'deployment', 'infrastructure']
-        technical_count = sum(1 for word in words if word.lower() in technical_terms)
+        technical_count = sum(map(self._TECHNICAL_TERMS.__contains__, map(str.lower, words)))
         technical_density = technical_count / len(words)
         
         # Normalize scores
@@ -376,3 +858,87 @@ class JobRequirementsExtractor:
             recommendations.append("This job has fewer requirements - may be more entry-level")
         
         return recommendations
+
+    def encode_normalized(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts as unit-length sentence embeddings.
+        
+        Embeddings of texts encoded before are reused; only new texts go
+        through the sentence transformer.
+        
+        Args:
+            texts: List of texts to encode
+            
+        Returns:
+            Array of shape (len(texts), embedding_dim)
+        """
+        if self.sentence_transformer is None:
+            raise RuntimeError("Sentence transformer is not available")
+        if not texts:
+            return np.empty((0, self.sentence_transformer.get_sentence_embedding_dimension()), dtype=np.float32)
+        
+        embeddings = self._embed_normalized(texts)
+        if self.device == "cuda":
+            return embeddings.float().cpu().numpy()
+        return embeddings
+
+    def _embed_normalized(self, texts: List[str]):
+        """
+        Stack cached or freshly encoded unit-length embeddings for a non-empty list of texts.
+        
+        On GPU the embeddings stay on the device as a torch tensor; on CPU
+        they are a numpy array.
+        """
+        on_gpu = self.device == "cuda"
+        embeddings = [None] * len(texts)
+        missing = {}
+        with self._embedding_cache_lock:
+            for i, text in enumerate(texts):
+                key = self._text_key(text)
+                embedding = self._embedding_cache.get(key)
+                if embedding is not None:
+                    self._embedding_cache.move_to_end(key)
+                    embeddings[i] = embedding
+                else:
+                    missing.setdefault(key, []).append(i)
+        
+        if missing:
+            encoded = self.sentence_transformer.encode(
+                [texts[indices[0]] for indices in missing.values()],
+                batch_size=64, normalize_embeddings=True,
+                convert_to_numpy=not on_gpu, convert_to_tensor=on_gpu
+            )
+            with self._embedding_cache_lock:
+                for (key, indices), embedding in zip(missing.items(), encoded):
+                    # Copy the row so the cache does not keep the whole batch alive
+                    embedding = embedding.clone() if on_gpu else embedding.copy()
+                    self._embedding_cache[key] = embedding
+                    for i in indices:
+                        embeddings[i] = embedding
+                while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+        
+        return torch.stack(embeddings) if on_gpu else np.vstack(embeddings)
+
+    def requirement_similarity(self, requirements: List[str], texts: List[str]) -> np.ndarray:
+        """
+        Score how closely each requirement matches each text (e.g. resume sentences).
+        
+        Args:
+            requirements: List of requirement texts
+            texts: List of texts to compare against
+            
+        Returns:
+            Cosine similarity matrix of shape (len(requirements), len(texts))
+        """
+        if not requirements or not texts:
+            return np.zeros((len(requirements), len(texts)), dtype=np.float32)
+        if self.sentence_transformer is None:
+            raise RuntimeError("Sentence transformer is not available")
+        
+        # Embeddings are unit length, so one matrix product gives the cosine similarities
+        similarity = self._embed_normalized(requirements) @ self._embed_normalized(texts).T
+        if self.device == "cuda":
+            # Only the similarity matrix leaves the GPU
+            return similarity.float().cpu().numpy()
+        return similarity
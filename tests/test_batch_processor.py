@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test the batch processor's result aggregation.
+"""
+
+import os
+import csv
+import tempfile
+
+from job_requirements_extractor import BatchJobProcessor, JobRequirementsExtractor
+
+SAMPLE_RESULTS = [
+    {
+        'text_length': 100,
+        'word_count': 20,
+        'complexity_score': 4.0,
+        'requirements': {
+            'summary': {'estimated_requirements': 3},
+            'categorized_requirements': {'experience': ['a', 'b'], 'tools': ['c']}
+        }
+    },
+    {
+        'text_length': 50,
+        'word_count': 10,
+        'complexity_score': 2.0,
+        'requirements': {
+            'summary': {'estimated_requirements': 1},
+            'categorized_requirements': {'experience': ['d']}
+        }
+    },
+    {'error': 'File not found', 'file_info': {'filename': 'missing.txt', 'file_path': 'missing.txt'}}
+]
+
+def test_generate_summary_report():
+    """Test that the summary report aggregates successful results and counts failures."""
+    processor = BatchJobProcessor(verbose=False)
+    processor.results = SAMPLE_RESULTS
+    
+    report = processor.generate_summary_report()
+    
+    assert report['total_files_processed'] == 3
+    assert report['successful_analyses'] == 2
+    assert report['failed_analyses'] == 1
+    assert report['aggregate_metrics'] == {
+        'total_text_length': 150,
+        'total_word_count': 30,
+        'average_complexity_score': 3.0
+    }
+    assert report['requirements_summary'] == {
+        'total_requirements_found': 4,
+        'average_requirements_per_job': 2.0
+    }
+    assert report['category_distribution'] == {'experience': 3, 'tools': 1}
+
+def test_generate_summary_report_all_failed():
+    """Test that a batch where every file failed is summarized without dividing by zero."""
+    processor = BatchJobProcessor(verbose=False)
+    processor.results = [SAMPLE_RESULTS[2], SAMPLE_RESULTS[2]]
+    
+    report = processor.generate_summary_report()
+    
+    assert report['successful_analyses'] == 0
+    assert report['failed_analyses'] == 2
+    assert report['success_rate'] == 0
+    assert report['aggregate_metrics']['average_complexity_score'] == 0
+    assert report['requirements_summary']['average_requirements_per_job'] == 0
+    assert report['category_distribution'] == {}
+
+def test_generate_summary_report_without_results():
+    """Test that an empty processor reports that there is nothing to summarize."""
+    processor = BatchJobProcessor(verbose=False)
+    
+    assert processor.generate_summary_report() == {"error": "No results to summarize"}
+
+def test_save_results_csv_includes_all_categories():
+    """Test that CSV output has a count column for every category seen in any result."""
+    processor = BatchJobProcessor(verbose=False)
+    processor.results = SAMPLE_RESULTS
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, 'results.csv')
+        processor.save_results(output_path, 'csv')
+        with open(output_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+    
+    assert len(rows) == 3
+    assert [row['experience_count'] for row in rows] == ['2', '1', '0']
+    assert [row['tools_count'] for row in rows] == ['1', '0', '0']
+    assert rows[2]['filename'] == 'missing.txt'
+    assert (rows[2]['text_length'], rows[2]['word_count']) == ('0', '0')
+    assert float(rows[2]['complexity_score']) == 0
+
+def test_save_results_csv_all_failed():
+    """Test that CSV output keeps the metric columns, set to 0, when every analysis failed."""
+    processor = BatchJobProcessor(verbose=False)
+    processor.results = [SAMPLE_RESULTS[2]]
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, 'results.csv')
+        processor.save_results(output_path, 'csv')
+        with open(output_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+    
+    assert list(rows[0]) == ['filename', 'file_path', 'text_length', 'word_count', 'complexity_score']
+    assert (rows[0]['text_length'], rows[0]['word_count']) == ('0', '0')
+    assert float(rows[0]['complexity_score']) == 0
+
+def test_processors_share_extractor():
+    """Test that processors for the same model reuse one loaded extractor."""
+    first = BatchJobProcessor(verbose=False)
+    second = BatchJobProcessor(verbose=False)
+    
+    assert first.extractor is second.extractor
+
+def test_process_directory_includes_dot_files():
+    """Test that directory listing matches glob('*.txt'), including names starting with a dot."""
+    processor = BatchJobProcessor(verbose=False)
+    # Pattern extraction is enough here, so skip loading the NER model
+    processor.extractor = JobRequirementsExtractor(use_ner=False, analysis_cache_size=0)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in ('.hidden.txt', 'job.txt', 'notes.csv'):
+            with open(os.path.join(tmp_dir, name), 'w', encoding='utf-8') as f:
+                f.write("Python experience is required.")
+        os.mkdir(os.path.join(tmp_dir, 'folder.txt'))
+        
+        results = processor.process_directory(tmp_dir, ['.txt'], max_workers=1)
+    
+    assert [result['file_info']['filename'] for result in results] == ['.hidden.txt', 'job.txt']
+
+if __name__ == "__main__":
+    test_generate_summary_report()
+    test_generate_summary_report_all_failed()
+    test_generate_summary_report_without_results()
+    test_save_results_csv_includes_all_categories()
+    test_save_results_csv_all_failed()
+    test_processors_share_extractor()
+    test_process_directory_includes_dot_files()
+    print("✅ Batch processor tests passed!")
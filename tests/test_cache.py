@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test the analysis cache used to skip re-analysis of duplicate descriptions.
+"""
+
+from job_requirements_extractor.cache import AnalysisCache
+
+def test_cache_hit_returns_copy():
+    """Test that a cached analysis is returned without exposing the stored entry."""
+    cache = AnalysisCache(maxsize=2)
+    key = cache.make_key("model", "We need a Python developer")
+    
+    assert cache.get(key) is None
+    cache.put(key, {'word_count': 5})
+    
+    analysis = cache.get(key)
+    assert analysis == {'word_count': 5}
+    
+    # Adding file metadata to the returned copy must not leak into the cache
+    analysis['file_info'] = {'filename': 'job.txt'}
+    assert cache.get(key) == {'word_count': 5}
+    assert cache.hits == 2 and cache.misses == 1
+
+def test_cache_keys_depend_on_model_and_text():
+    """Test that keys differ by model and by text."""
+    key = AnalysisCache.make_key("model", "text")
+    assert key == AnalysisCache.make_key("model", "text")
+    assert key != AnalysisCache.make_key("other-model", "text")
+    assert key != AnalysisCache.make_key("model", "other text")
+
+def test_cache_evicts_least_recently_used():
+    """Test that the cache keeps at most maxsize entries."""
+    cache = AnalysisCache(maxsize=2)
+    keys = [cache.make_key("model", text) for text in ("a", "b", "c")]
+    
+    cache.put(keys[0], {'id': 0})
+    cache.put(keys[1], {'id': 1})
+    cache.get(keys[0])  # keys[0] is now the most recently used
+    cache.put(keys[2], {'id': 2})
+    
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == {'id': 0}
+
+if __name__ == "__main__":
+    test_cache_hit_returns_copy()
+    test_cache_keys_depend_on_model_and_text()
+    test_cache_evicts_least_recently_used()
+    print("✅ Cache tests passed!")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the extractor's requirement assembly.
+"""
+
+from job_requirements_extractor import JobRequirementsExtractor
+from job_requirements_extractor.extractor import _NOT_LOADED, _keyword_pattern, _keyword_regex
+
+SAMPLE_JOB = """
+Backend Developer
+
+The candidate must have 3+ years of experience with Python.
+- Bachelor's degree in Computer Science required
+- Experience with Docker and AWS
+- Familiarity with agile methodologies
+"""
+
+def test_list_extraction_runs_once_per_description():
+    """Test that categorization and the summary reuse the extracted requirement lists."""
+    extractor = JobRequirementsExtractor(use_ner=False)
+    calls = {'individual': 0, 'text': 0}
+    
+    extract_individual = extractor._extract_individual_requirements
+    extract_text = extractor._extract_text_patterns
+    
+    def count_individual(text):
+        calls['individual'] += 1
+        return extract_individual(text)
+    
+    def count_text(text):
+        calls['text'] += 1
+        return extract_text(text)
+    
+    extractor._extract_individual_requirements = count_individual
+    extractor._extract_text_patterns = count_text
+    
+    requirements = extractor.extract_requirements(SAMPLE_JOB)
+    
+    # Once on the original text; sentence patterns once each on the original and cleaned text
+    assert calls == {'individual': 1, 'text': 2}
+    assert requirements['summary']['estimated_requirements'] > 0
+    assert 'experience' in requirements['categorized_requirements']
+
+def test_repeated_analysis_is_cached():
+    """Test that analyzing the same text twice reuses the first analysis until the cache is cleared."""
+    extractor = JobRequirementsExtractor(use_ner=False)
+    calls = []
+    
+    extract = extractor.extract_requirements
+    
+    def count_extract(text):
+        calls.append(text)
+        return extract(text)
+    
+    extractor.extract_requirements = count_extract
+    
+    first = extractor.analyze_job_description(SAMPLE_JOB)
+    second = extractor.analyze_job_description(SAMPLE_JOB)
+    assert len(calls) == 1
+    assert second == first
+    
+    # The returned analysis is a copy; adding keys does not touch the cached entry
+    second['file_info'] = {'filename': 'job.txt'}
+    assert 'file_info' not in extractor.analyze_job_description(SAMPLE_JOB)
+    
+    extractor.clear_cache()
+    assert extractor.analyze_job_description(SAMPLE_JOB) == first
+    assert len(calls) == 2
+
+def test_batch_extracts_repeated_descriptions_once():
+    """Test that identical descriptions in a batch are extracted once and returned in input order."""
+    extractor = JobRequirementsExtractor(use_ner=False)
+    assembled = []
+    
+    assemble = extractor._assemble_requirements
+    
+    def count_assemble(text, cleaned_text, entities):
+        assembled.append(text)
+        return assemble(text, cleaned_text, entities)
+    
+    extractor._assemble_requirements = count_assemble
+    
+    other_job = "Data Analyst\n\nExperience with SQL and Excel is required."
+    results = extractor.extract_requirements_batch([SAMPLE_JOB, other_job, SAMPLE_JOB, ""])
+    
+    assert assembled == [SAMPLE_JOB, other_job]
+    assert results[0] == results[2]
+    assert results[0] is not results[2]
+    assert results[1] == extractor.extract_requirements(other_job)
+    assert results[3] == {"error": "No job description provided"}
+
+def test_keyword_matcher_agrees_with_regex():
+    """Test that the keyword matcher finds a keyword exactly when the regex fallback does."""
+    keywords = ['skill', 'skills', 'must', 'required', 'ci/cd', 'c++', 'we offer']
+    texts = [
+        "strong communication skills",
+        "you must know c++",
+        "experience with ci/cd pipelines",
+        "we offer competitive salary",
+        "we provide great benefits",
+        "mustard and skillet",
+        ""
+    ]
+    
+    matcher = _keyword_pattern(keywords)
+    regex = _keyword_regex(keywords)
+    for text in texts:
+        assert bool(matcher.search(text)) == bool(regex.search(text)), text
+
+def test_entity_batch_without_texts_skips_model():
+    """Test that a batch with nothing for the model neither loads nor tokenizes with it."""
+    extractor = JobRequirementsExtractor()
+    
+    assert extractor._extract_entities_batch(['', '']) == [[], []]
+    assert extractor._ner_pipeline is _NOT_LOADED
+
+if __name__ == "__main__":
+    test_list_extraction_runs_once_per_description()
+    test_repeated_analysis_is_cached()
+    test_batch_extracts_repeated_descriptions_once()
+    test_keyword_matcher_agrees_with_regex()
+    test_entity_batch_without_texts_skips_model()
+    print("✅ Extractor tests passed!")
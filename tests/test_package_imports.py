@@ -3,11 +3,12 @@
 Test that the package imports work correctly after refactoring.
 """
 
-import sys
 import os
 
-# Add the src directory to the path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+def _log(message: str):
+    """Print a progress message when VERBOSE is set in the environment."""
+    if os.environ.get("VERBOSE"):
+        print(message)
 
 def test_package_imports():
     """Test that we can import the main package components."""
@@ -19,7 +20,7 @@ def test_package_imports():
             REQUIREMENT_PATTERNS,
             REQUIREMENT_CATEGORIES
         )
-        print("✅ Package imports successful!")
+        _log("✅ Package imports successful!")
         return True
     except ImportError as e:
         print(f"❌ Package import failed: {e}")
@@ -30,7 +31,7 @@ def test_extractor_instantiation():
     try:
         from job_requirements_extractor import JobRequirementsExtractor
         extractor = JobRequirementsExtractor()
-        print("✅ Extractor instantiation successful!")
+        _log("✅ Extractor instantiation successful!")
         return True
     except Exception as e:
         print(f"❌ Extractor instantiation failed: {e}")
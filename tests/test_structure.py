@@ -3,92 +3,95 @@
 Test the package structure without requiring external dependencies.
 """
 
+import mmap
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
+def _index_tree() -> dict:
+    """
+    Map the project paths the structure tests look at to whether they are directories.
+    
+    Covers the top-level entries plus everything under src/ and tests/, as
+    POSIX-style paths relative to the project root. Built in one directory
+    sweep; the file types come from the directory listing, not extra stat calls.
+    """
+    tree = {}
+    with os.scandir(".") as entries:
+        for entry in entries:
+            tree[entry.name] = entry.is_dir()
+            if entry.name in ("src", "tests") and tree[entry.name]:
+                for dirpath, dirnames, filenames in os.walk(entry.name):
+                    for name in dirnames:
+                        tree[Path(dirpath, name).as_posix()] = True
+                    for name in filenames:
+                        tree[Path(dirpath, name).as_posix()] = False
+    return tree
+
+def _log(message: str):
+    """Print a progress message when VERBOSE is set in the environment."""
+    if os.environ.get("VERBOSE"):
+        print(message)
+
+def _missing(paths: set, must_be_dir: bool) -> list:
+    """Return the paths that are absent or not a directory/file as expected, sorted."""
+    present = {path for path, is_dir in _index_tree().items() if is_dir == must_be_dir}
+    return sorted(paths - present)
+
 def test_directory_structure():
     """Test that the expected directory structure exists."""
-    print("Testing directory structure...")
-    
-    # Check that src directory exists
-    src_path = Path("src")
-    assert src_path.exists(), "src directory should exist"
-    assert src_path.is_dir(), "src should be a directory"
-    
-    # Check that tests directory exists
-    tests_path = Path("tests")
-    assert tests_path.exists(), "tests directory should exist"
-    assert tests_path.is_dir(), "tests should be a directory"
-    
-    # Check that package directory exists
-    package_path = src_path / "job_requirements_extractor"
-    assert package_path.exists(), "job_requirements_extractor package should exist"
-    assert package_path.is_dir(), "job_requirements_extractor should be a directory"
-    
-    # Check that __init__.py exists in package
-    init_file = package_path / "__init__.py"
-    assert init_file.exists(), "__init__.py should exist in package"
-    
-    # Check that main modules exist
-    extractor_file = package_path / "extractor.py"
-    assert extractor_file.exists(), "extractor.py should exist in package"
-    
-    batch_processor_file = package_path / "batch_processor.py"
-    assert batch_processor_file.exists(), "batch_processor.py should exist in package"
-    
-    config_file = package_path / "config.py"
-    assert config_file.exists(), "config.py should exist in package"
-    
-    # Check that entry points exist
-    app_file = src_path / "app.py"
-    assert app_file.exists(), "app.py should exist in src"
-    
-    cli_file = src_path / "cli.py"
-    assert cli_file.exists(), "cli.py should exist in src"
-    
-    print("✅ Directory structure is correct!")
+    _log("Testing directory structure...")
+    
+    # Check that src, tests and the package are directories
+    missing = _missing({"src", "tests", "src/job_requirements_extractor"}, True)
+    assert not missing, f"Missing directories: {missing}"
+    
+    # Check that the package modules and entry points exist
+    missing = _missing({
+        "src/job_requirements_extractor/__init__.py",
+        "src/job_requirements_extractor/extractor.py",
+        "src/job_requirements_extractor/batch_processor.py",
+        "src/job_requirements_extractor/config.py",
+        "src/app.py",
+        "src/cli.py"
+    }, False)
+    assert not missing, f"Missing files: {missing}"
+    
+    _log("✅ Directory structure is correct!")
 
 def test_package_files():
     """Test that package files contain expected content."""
-    print("Testing package files...")
+    _log("Testing package files...")
     
     # Check __init__.py has expected imports
     init_file = Path("src/job_requirements_extractor/__init__.py")
-    with open(init_file, 'r') as f:
-        content = f.read()
-        assert "JobRequirementsExtractor" in content, "__init__.py should export JobRequirementsExtractor"
-        assert "BatchJobProcessor" in content, "__init__.py should export BatchJobProcessor"
-    
-    # Check that setup.py exists
-    setup_file = Path("setup.py")
-    assert setup_file.exists(), "setup.py should exist"
-    
-    # Check that pyproject.toml exists
-    pyproject_file = Path("pyproject.toml")
-    assert pyproject_file.exists(), "pyproject.toml should exist"
+    with open(init_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        assert content.find(b"JobRequirementsExtractor") != -1, "__init__.py should export JobRequirementsExtractor"
+        assert content.find(b"BatchJobProcessor") != -1, "__init__.py should export BatchJobProcessor"
     
-    # Check that pytest.ini exists
-    pytest_file = Path("pytest.ini")
-    assert pytest_file.exists(), "pytest.ini should exist"
+    # Check that the packaging and test configuration files exist
+    missing = _missing({"setup.py", "pyproject.toml", "pytest.ini"}, False)
+    assert not missing, f"Missing files: {missing}"
     
-    print("✅ Package files are correct!")
+    _log("✅ Package files are correct!")
 
 def test_test_files():
     """Test that test files exist."""
-    print("Testing test files...")
+    _log("Testing test files...")
     
-    tests_path = Path("tests")
+    tree = _index_tree()
     
-    # Check that test files exist
-    test_files = list(tests_path.glob("test_*.py"))
-    assert len(test_files) > 0, "Should have at least one test file"
+    # Check that test files exist directly under tests/
+    test_files = sum(1 for path in tree
+                     if path.startswith("tests/test_") and path.endswith(".py") and path.count("/") == 1)
+    assert test_files > 0, "Should have at least one test file"
     
     # Check that our structure test exists
-    structure_test = tests_path / "test_structure.py"
-    assert structure_test.exists(), "test_structure.py should exist"
+    assert "tests/test_structure.py" in tree, "test_structure.py should exist"
     
-    print(f"✅ Found {len(test_files)} test files!")
+    _log(f"✅ Found {test_files} test files!")
 
 def main():
     """Run all structure tests."""